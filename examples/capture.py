@@ -28,8 +28,11 @@ if __name__ == "__main__":
         env.update(dict(TERM="linux", COLUMNS="80", LINES="24"))
         os.execvpe(argv[0], argv, env=env)
 
+    os.set_blocking(master_fd, False)
+
     with open(output_path, "wb") as handle:
-        while True:
+        eof = False
+        while not eof:
             try:
                 [_master_fd], _wlist, _xlist = select.select(
                     [master_fd], [], [], 1)
@@ -37,14 +40,26 @@ if __name__ == "__main__":
                     ValueError):        # Nothing to read.
                 break
 
-            try:
-                data = os.read(master_fd, 1024)
-            except OSError:
-                break
+            # Drain the fd completely before going back to ``select``,
+            # so a fast producer costs us a few big reads instead of
+            # thousands of small ones.
+            chunks = []
+            while True:
+                try:
+                    data = os.read(master_fd, 65536)
+                except BlockingIOError:
+                    break
+                except OSError:
+                    eof = True
+                    break
 
-            if not data:
-                break
+                if not data:
+                    eof = True
+                    break
+
+                chunks.append(data)
 
-            handle.write(data)
+            if chunks:
+                handle.write(b"".join(chunks))
 
         os.kill(p_pid, signal.SIGTERM)
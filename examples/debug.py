@@ -11,6 +11,8 @@
     :license: LGPL, see LICENSE for more details.
 """
 
+import sys
+
 import pyte
 
 # A blob of `ADOM` output we need to debug. Hey! I know this is ugly ...
@@ -18,5 +20,9 @@ blob = b"""\x1b[25d\x1b[0;10m\x1b[39;49m\x1b[37m\x1b[40m\x1b[23;15H\x1b[37m\x1b[
 
 
 if __name__ == "__main__":
-    stream = pyte.ByteStream(pyte.DebugScreen())
-    stream.feed(blob)
+    # Buffer the debug output -- a single flush at the end beats one
+    # write syscall per decoded event when stdout is a pipe or file.
+    with open(sys.stdout.fileno(), "w", buffering=1 << 20,
+              closefd=False) as out:
+        stream = pyte.ByteStream(pyte.DebugScreen(to=out))
+        stream.feed(blob)
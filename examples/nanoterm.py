@@ -31,19 +31,38 @@ if __name__ == "__main__":
         os.execvpe(sys.argv[1], sys.argv[1:],
                    env=dict(TERM="linux", COLUMNS="80", LINES="24"))
 
-    while True:
+    os.set_blocking(master_fd, False)
+
+    eof = False
+    while not eof:
         try:
             [_master_fd], _wlist, _xlist = select.select(
                 [master_fd], [], [], 1)
         except (KeyboardInterrupt,  # Stop right now!
                 ValueError):        # Nothing to read.
             break
-        else:
-            data = os.read(master_fd, 1024)
+
+        # Drain the fd completely before going back to ``select`` and
+        # feed the stream one big chunk per wakeup, so long runs of
+        # plain text are not cut up by syscall boundaries.
+        chunks = []
+        while True:
+            try:
+                data = os.read(master_fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                eof = True
+                break
+
             if not data:
+                eof = True
                 break
 
-            stream.feed(data)
+            chunks.append(data)
+
+        if chunks:
+            stream.feed(b"".join(chunks))
 
     os.kill(p_pid, signal.SIGTERM)
     print(*screen.display, sep="\n")
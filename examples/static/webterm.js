@@ -4,9 +4,12 @@ window.onload = () => {
     let terminal = new Terminal("screen", 80, 24);
 
     let socket;
+    const decoder = new TextDecoder();
     function connect() {
         socket = new WebSocket(`ws://${window.location.host}/ws`);
-        socket.onmessage = e => terminal.update(JSON.parse(e.data));
+        socket.binaryType = "arraybuffer";
+        socket.onmessage =
+            e => terminal.update(JSON.parse(decoder.decode(e.data)));
         socket.onclose = () => setTimeout(connect, 5000)
     }
 
@@ -55,7 +58,7 @@ class Terminal {
         return document.getElementById(`char_${i}_${j}`);
     }
 
-    update({c: [cx, cy], lines}) {
+    update({c: [cx, cy], cells}) {
         // Manual line feed hack. ``pyte.Screen`` does that lazily.
         if (cx == this.width) {
             cx = 0;
@@ -64,17 +67,19 @@ class Terminal {
 
         this.eraseCursor();
 
-        for (let [i, line] of lines) {
-            for (let j = 0; j < this.width; j++) {
-                const [data, reverse, fg, bg] = line[j];
-                const char = this.charAt(i, j);
-                char.innerText = data;
-
-                if (reverse) {
-                    this.setStyle(char, bg, fg);
-                } else {
-                    this.setStyle(char, fg, bg);
-                }
+        for (let [i, j, data, reverse, fg, bg] of cells) {
+            const char = this.charAt(i, j);
+            char.innerText = data;
+            // Remember the real style so the cursor overlay can be
+            // undone without a server round-trip.
+            char.dataset.fg = fg;
+            char.dataset.bg = bg;
+            char.dataset.reverse = reverse ? "1" : "";
+
+            if (reverse) {
+                this.setStyle(char, bg, fg);
+            } else {
+                this.setStyle(char, fg, bg);
             }
         }
 
@@ -98,7 +103,18 @@ class Terminal {
 
     eraseCursor() {
         const {x, y} = this.cursor;
-        this.setStyle(this.charAt(y, x), "default", "default");
+        const char = this.charAt(y, x);
+        if (char === null) {
+            return;
+        }
+
+        const fg = char.dataset.fg || "default";
+        const bg = char.dataset.bg || "default";
+        if (char.dataset.reverse) {
+            this.setStyle(char, bg, fg);
+        } else {
+            this.setStyle(char, fg, bg);
+        }
     }
 }
 
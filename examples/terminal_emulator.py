@@ -28,6 +28,19 @@ from textual.app import App
 from textual.widget import Widget
 
 
+async def queue_put(queue, item):
+    """Put with a synchronous fast path.
+
+    ``put_nowait`` on a non-full queue skips the coroutine step and the
+    scheduler hop of ``await queue.put(...)``; only a full queue pays
+    for the await (and provides backpressure).
+    """
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        await queue.put(item)
+
+
 class PyteDisplay:
     def __init__(self, lines):
         self.lines = lines
@@ -50,8 +63,12 @@ class Terminal(Widget, can_focus=True):
         self.nrow = nrow
         self.ncol = ncol
         self._display = PyteDisplay([Text()])
+        # Parsed ``Text`` per row keyed by the raw line string -- ANSI
+        # parsing is the dominant render cost, so only re-parse rows
+        # whose contents actually changed.
+        self._line_cache = [("", Text()) for _ in range(nrow)]
         self._screen = pyte.Screen(self.ncol, self.nrow)
-        self.stream = pyte.Stream(self._screen)
+        self.stream = pyte.ByteStream(self._screen)
         asyncio.create_task(self.recv())
         super().__init__()
         self.focus()
@@ -61,28 +78,44 @@ class Terminal(Widget, can_focus=True):
 
     async def on_key(self, event: events.Key) -> None:
         char = self.ctrl_keys.get(event.key) or event.character
-        await self.send_queue.put(["stdin", char])
+        await queue_put(self.send_queue, ["stdin", char])
 
     async def recv(self):
         while True:
             message = await self.recv_queue.get()
             cmd = message[0]
             if cmd == "setup":
-                await self.send_queue.put(["set_size", self.nrow, self.ncol, 567, 573])
+                await queue_put(self.send_queue,
+                                ["set_size", self.nrow, self.ncol, 567, 573])
             elif cmd == "stdout":
                 chars = message[1]
+                prev_cursor = (self._screen.cursor.x, self._screen.cursor.y)
                 self.stream.feed(chars)
+                # Re-read the cursor: restore_cursor and reset rebind
+                # it to a new object during feed.
+                cursor = self._screen.cursor
+                if (not self._screen.dirty
+                        and (cursor.x, cursor.y) == prev_cursor):
+                    # Nothing visible changed -- skip the render.
+                    continue
+                # Re-parse only rows pyte marked as dirty; the rest are
+                # served from the per-row cache.
+                display = self._screen.display
+                for y in self._screen.dirty:
+                    line = display[y]
+                    if line != self._line_cache[y][0]:
+                        self._line_cache[y] = (line, Text.from_ansi(line))
+                self._screen.dirty.clear()
                 lines = []
-                for i, line in enumerate(self._screen.display):
-                    text = Text.from_ansi(line)
+                for i in range(self.nrow):
+                    text = self._line_cache[i][1]
                     x = self._screen.cursor.x
                     if i == self._screen.cursor.y and x < len(text):
-                        cursor = text[x]
-                        cursor.stylize("reverse")
-                        new_text = text[:x]
-                        new_text.append(cursor)
-                        new_text.append(text[x + 1:])
-                        text = new_text
+                        # Copy so the cached Text stays pristine, then
+                        # restyle the cursor cell in place -- no slice
+                        # and re-append churn.
+                        text = text.copy()
+                        text.stylize("reverse", x, x + 1)
                     lines.append(text)
                 self._display = PyteDisplay(lines)
                 self.refresh()
@@ -93,11 +126,12 @@ class TerminalEmulator(App):
     def __init__(self, ncol, nrow):
         self.ncol = ncol
         self.nrow = nrow
-        self.data_or_disconnect = None
+        self._pty_buf = bytearray()
+        self._closed = False
         self.fd = self.open_terminal()
         self.p_out = os.fdopen(self.fd, "w+b", 0)
-        self.recv_queue = asyncio.Queue()
-        self.send_queue = asyncio.Queue()
+        self.recv_queue = asyncio.Queue(maxsize=64)
+        self.send_queue = asyncio.Queue(maxsize=64)
         self.event = asyncio.Event()
         super().__init__()
 
@@ -116,22 +150,29 @@ class TerminalEmulator(App):
 
     async def _run(self):
         loop = asyncio.get_running_loop()
+        emulator = self
+
+        class PtyProtocol(asyncio.Protocol):
+            """Accumulates pty output between event-loop ticks.
+
+            ``data_received`` gets bytes straight from the transport --
+            no reader callback, no extra read syscall, no decode.
+            """
+
+            def data_received(self, data):
+                emulator._pty_buf += data
+                emulator.event.set()
+
+            def connection_lost(self, exc):
+                emulator._closed = True
+                emulator.event.set()
 
-        def on_output():
-            try:
-                self.data_or_disconnect = self.p_out.read(65536).decode()
-                self.event.set()
-            except Exception:
-                loop.remove_reader(self.p_out)
-                self.data_or_disconnect = None
-                self.event.set()
-
-        loop.add_reader(self.p_out, on_output)
-        await self.send_queue.put(["setup", {}])
+        await loop.connect_read_pipe(PtyProtocol, self.p_out)
+        await queue_put(self.send_queue, ["setup", {}])
         while True:
             msg = await self.recv_queue.get()
             if msg[0] == "stdin":
-                self.p_out.write(msg[1].encode())
+                os.write(self.fd, msg[1].encode())
             elif msg[0] == "set_size":
                 winsize = struct.pack("HH", msg[1], msg[2])
                 fcntl.ioctl(self.fd, termios.TIOCSWINSZ, winsize)
@@ -140,10 +181,13 @@ class TerminalEmulator(App):
         while True:
             await self.event.wait()
             self.event.clear()
-            if self.data_or_disconnect is None:
-                await self.send_queue.put(["disconnect", 1])
-            else:
-                await self.send_queue.put(["stdout", self.data_or_disconnect])
+            if self._pty_buf:
+                data = bytes(self._pty_buf)
+                self._pty_buf.clear()
+                await queue_put(self.send_queue, ["stdout", data])
+            if self._closed:
+                await queue_put(self.send_queue, ["disconnect", 1])
+                return
 
 
 if __name__ == "__main__":
@@ -37,6 +37,23 @@ from aiohttp import web
 
 import pyte
 
+try:
+    import orjson
+
+    def dump_json(obj):
+        return orjson.dumps(obj)
+except ImportError:  # Fall back to the stdlib encoder.
+    def dump_json(obj):
+        return json.dumps(obj).encode()
+
+
+# Client messages that page the history instead of going to the pty,
+# mapped to the ``HistoryScreen`` method handling them.
+_PAGE_CMDS = {
+    pyte.control.ESC + "N": "next_page",
+    pyte.control.ESC + "P": "prev_page",
+}
+
 
 class Terminal:
     def __init__(self, columns, lines, p_in):
@@ -47,20 +64,36 @@ class Terminal:
         self.stream = pyte.ByteStream()
         self.stream.attach(self.screen)
 
+        # Shadow of the cells sent to the client so :meth:`dumps` can
+        # emit only cells that actually changed, plus a reusable output
+        # list.
+        self._shadow = [[None] * columns for _ in range(lines)]
+        self._out_cells = []
+
     def feed(self, data):
         self.stream.feed(data)
 
-    def dumps(self):
+    def dumps(self, dirty):
+        """Encodes the rows in ``dirty`` -- a snapshot taken by the
+        caller on the event-loop thread, since ``dumps`` itself may run
+        on a worker thread while the loop keeps feeding the screen.
+        """
         cursor = self.screen.cursor
-        lines = []
-        for y in self.screen.dirty:
+        columns = range(self.screen.columns)
+        cells = self._out_cells
+        cells.clear()
+        for y in dirty:
             line = self.screen.buffer[y]
-            data = [(char.data, char.reverse, char.fg, char.bg)
-                    for char in (line[x] for x in range(self.screen.columns))]
-            lines.append((y, data))
+            shadow = self._shadow[y]
+            # A dirty row is mostly unchanged during interactive use --
+            # diff against the shadow and ship only the changed cells.
+            for x, char in enumerate(map(line.__getitem__, columns)):
+                cell = (char.data, char.reverse, char.fg, char.bg)
+                if cell != shadow[x]:
+                    shadow[x] = cell
+                    cells.append((y, x) + cell)
 
-        self.screen.dirty.clear()
-        return json.dumps({"c": (cursor.x, cursor.y), "lines": lines})
+        return dump_json({"c": (cursor.x, cursor.y), "cells": cells})
 
 
 def open_terminal(command="bash", columns=80, lines=24):
@@ -72,6 +105,9 @@ def open_terminal(command="bash", columns=80, lines=24):
         os.execvpe(argv[0], argv, env)
 
     # File-like object for I/O with the child process aka command.
+    # The fd is non-blocking so readers can drain it completely on
+    # each readiness callback.
+    os.set_blocking(master_fd, False)
     p_out = os.fdopen(master_fd, "w+b", 0)
     return Terminal(columns, lines, p_out), p_pid, p_out
 
@@ -83,23 +119,51 @@ async def websocket_handler(request):
     request.app["websockets"].add(asyncio.current_task())
 
     terminal, p_pid, p_out = open_terminal()
-    await ws.send_str(terminal.dumps())
+
+    # Coalesce sends behind a dirty flag: many pty reads between two
+    # event-loop ticks produce a single dumps() + websocket frame.
+    dirty = asyncio.Event()
+    dirty.set()  # Send the initial screen.
+
+    async def sender():
+        loop = asyncio.get_running_loop()
+        while True:
+            await dirty.wait()
+            dirty.clear()
+            # Snapshot and clear the dirty set here, on the event-loop
+            # thread -- the worker below must not iterate or mutate a
+            # set the loop keeps updating.  Rows dirtied mid-encode stay
+            # in the set until the next send.
+            rows = sorted(terminal.screen.dirty)
+            terminal.screen.dirty.difference_update(rows)
+            # Serialize on a worker thread so the encode overlaps the
+            # next pty read instead of stalling the event loop.
+            payload = await loop.run_in_executor(None, terminal.dumps, rows)
+            await ws.send_bytes(payload)
+
+    sender_task = asyncio.create_task(sender())
 
     def on_master_output():
-        terminal.feed(p_out.read(65536))
-        asyncio.create_task(ws.send_str(terminal.dumps()))
+        # Drain the pty completely and feed one big chunk per wakeup.
+        chunks = []
+        while True:
+            data = p_out.read(65536)
+            if not data:  # ``None`` -- drained, ``b""`` -- EOF.
+                break
+            chunks.append(data)
+        if chunks:
+            terminal.feed(b"".join(chunks))
+            dirty.set()
 
     loop = asyncio.get_event_loop()
     loop.add_reader(p_out, on_master_output)
     try:
         async for msg in ws:
             if msg.type == aiohttp.WSMsgType.TEXT:
-                if msg.data == pyte.control.ESC + "N":
-                    terminal.screen.next_page()
-                    ws.send_str(terminal.dumps())
-                elif msg.data == pyte.control.ESC + "P":
-                    terminal.screen.prev_page()
-                    ws.send_str(terminal.dumps())
+                op = _PAGE_CMDS.get(msg.data)
+                if op is not None:
+                    getattr(terminal.screen, op)()
+                    dirty.set()
                 else:
                     p_out.write(msg.data.encode())
             elif msg.type == aiohttp.WSMsgType.ERROR:
@@ -108,6 +172,7 @@ async def websocket_handler(request):
             OSError):  # Process died?
         pass
     finally:
+        sender_task.cancel()
         loop.remove_reader(p_out)
         os.kill(p_pid, signal.SIGTERM)
         p_out.close()
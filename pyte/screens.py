@@ -26,16 +26,17 @@
 """
 from __future__ import annotations
 
-import copy
 import json
 import math
 import os
+import re
 import sys
 import unicodedata
 import warnings
+from bisect import bisect_right
 from collections import deque, defaultdict
-from functools import lru_cache
-from typing import Any, Callable, Dict, Generator, List, NamedTuple, Optional, Set, Sequence, TextIO, TypeVar
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Generator, List, NamedTuple, Optional, Set, Sequence, TextIO, Tuple, TypeVar
 
 from wcwidth import wcwidth as _wcwidth  # type: ignore[import-untyped]
 
@@ -47,7 +48,48 @@ from . import (
 )
 from .streams import Stream
 
-wcwidth: Callable[[str], int] = lru_cache(maxsize=4096)(_wcwidth)
+_wcwidth_cached: Callable[[str], int] = lru_cache(maxsize=4096)(_wcwidth)
+
+#: Printable ASCII is always width 1 and dominates typical input, so
+#: resolve it from a precomputed table and keep the cached ``wcwidth``
+#: only for the non-ASCII tail.
+_ASCII_WIDTHS = tuple(_wcwidth(chr(code)) for code in range(128))
+
+
+def wcwidth(char: str) -> int:
+    code = ord(char)
+    return _ASCII_WIDTHS[code] if code < 128 else _wcwidth_cached(char)
+
+
+#: A run of printable ASCII -- always width 1, never combining.  Used
+#: by :meth:`Screen.draw` to bulk-write such runs without per-character
+#: width and mode checks.
+_ASCII_RUN = re.compile("[\x20-\x7e]+")
+
+#: ``unicodedata.combining`` is consulted for every zero-width
+#: character; combining marks repeat heavily in accented text, so a
+#: small cache pays for itself.
+_combining: Callable[[str], int] = lru_cache(maxsize=1024)(
+    unicodedata.combining)
+
+#: NFC normalization is pure and the same (base, mark) pairs repeat
+#: heavily in accented text, so cache the composed results instead of
+#: re-running the algorithm per combining character.
+_normalize: Callable[[str, str], str] = lru_cache(maxsize=1024)(
+    unicodedata.normalize)
+
+#: Single-parameter SGR codes resolved to a ``Char`` field and its new
+#: value in one dict lookup, merged from the :mod:`pyte.graphics`
+#: tables.  0 (reset) and the 38/48 extended color introducers are
+#: handled separately in :meth:`Screen.select_graphic_rendition`.
+_SGR_TABLE: Dict[int, Tuple[str, Any]] = {
+    **{attr: ("fg", color) for attr, color in g.FG_ANSI.items()},
+    **{attr: ("bg", color) for attr, color in g.BG_ANSI.items()},
+    **{attr: ("fg", color) for attr, color in g.FG_AIXTERM.items()},
+    **{attr: ("bg", color) for attr, color in g.BG_AIXTERM.items()},
+    **{attr: (text[1:], text.startswith("+"))
+       for attr, text in g.TEXT.items()},
+}
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
@@ -85,6 +127,8 @@ class Char(NamedTuple):
                          during rendering. Defaults to ``False``.
     :param bool blink: flag for rendering the character blinked. Defaults to
                        ``False``.
+    :param int width: on-screen width of the character as reported by
+                      ``wcwidth`` at draw time. Defaults to ``1``.
     """
     data: str
     fg: str = "default"
@@ -95,6 +139,7 @@ class Char(NamedTuple):
     strikethrough: bool = False
     reverse: bool = False
     blink: bool = False
+    width: int = 1
 
 
 class Cursor:
@@ -115,6 +160,23 @@ class Cursor:
         self.hidden = False
 
 
+class _NullSet(Set[KT]):
+    """A :func:`set` which ignores all mutating operations.
+
+    Used in place of :attr:`~pyte.screens.Screen.dirty` when dirty line
+    tracking is disabled, so that the hot paths can update it
+    unconditionally.
+    """
+    def add(self, element: KT) -> None:
+        pass
+
+    def discard(self, element: object) -> None:
+        pass
+
+    def update(self, *args: Any) -> None:
+        pass
+
+
 class StaticDefaultDict(Dict[KT, VT]):
     """A :func:`dict` with a static default value.
 
@@ -127,6 +189,11 @@ class StaticDefaultDict(Dict[KT, VT]):
     >>> d
     {}
     """
+    #: Set by :meth:`Screen.draw` when a full-width character lands in
+    #: this row, letting :attr:`Screen.display` pick a faster rendering
+    #: path for the (common) rows without any.
+    _has_wide = False
+
     def __init__(self, default: VT) -> None:
         self.default = default
 
@@ -159,6 +226,9 @@ class Screen:
        >>> list(screen.dirty)
        [0]
 
+       Tracking can be turned off by passing ``track_dirty_lines=False``
+       to the constructor, in which case the set always stays empty.
+
        .. versionadded:: 0.7.0
 
     .. attribute:: cursor
@@ -210,15 +280,59 @@ class Screen:
     @property
     def default_char(self) -> Char:
         """An empty character with default foreground and background colors."""
-        reverse = mo.DECSCNM in self.mode
-        return Char(data=" ", fg="default", bg="default", reverse=reverse)
+        return self._default_char
 
-    def __init__(self, columns: int, lines: int) -> None:
+    def _refresh_default_char(self) -> None:
+        """Rebuild the cached :attr:`default_char`.
+
+        The default char only depends on ``DECSCNM``, so scrolling and
+        erase paths get a stored reference instead of a fresh ``Char``
+        per access.
+        """
+        reverse = mo.DECSCNM in self.mode
+        self._default_char = Char(data=" ", fg="default", bg="default",
+                                  reverse=reverse)
+        # Field/value pairs for mid-sequence SGR resets -- building a
+        # dict from a cached tuple is cheaper than ``_asdict()`` per
+        # reset.
+        self._default_char_items = tuple(self._default_char._asdict().items())
+
+    def _refresh_mode_flags(self) -> None:
+        """Recompute cached booleans for the modes hot paths test.
+
+        :meth:`draw` and the cursor-bounds checks probe ``IRM``,
+        ``DECAWM`` and ``DECOM`` per character or per movement; an
+        attribute read is cheaper than a set membership test each time.
+        """
+        mode = self.mode
+        self._irm = mo.IRM in mode
+        self._decawm = mo.DECAWM in mode
+        self._decom = mo.DECOM in mode
+
+    def __init__(self, columns: int, lines: int,
+                 track_dirty_lines: bool = True,
+                 disable_display_graphic: bool = False) -> None:
         self.savepoints: List[Savepoint] = []
         self.columns = columns
         self.lines = lines
-        self.buffer: Dict[int, StaticDefaultDict[int, Char]] = defaultdict(lambda: StaticDefaultDict[int, Char](self.default_char))
-        self.dirty: Set[int] = set()
+        self._row_pool: List[StaticDefaultDict[int, Char]] = []
+        self.buffer: Dict[int, StaticDefaultDict[int, Char]] = \
+            defaultdict(self._make_row)
+        self.dirty: Set[int] = set() if track_dirty_lines else _NullSet()
+        # Every line number, for the frequent "whole screen is dirty"
+        # marks -- a C-level set-to-set update instead of iterating a
+        # fresh ``range`` each time.  Rebuilt by :meth:`resize`.
+        self._all_lines = set(range(lines))
+        # Cheap bool gate for the per-character dirty marking in
+        # :meth:`draw`; colder call sites just use the set (or the
+        # no-op :class:`_NullSet`) directly.
+        self._track_dirty = track_dirty_lines
+        self._disable_display_graphic = disable_display_graphic
+
+        # A flyweight pool of Char instances for the current cursor
+        # attributes, see :meth:`draw`.
+        self._cached_attrs: Optional[Char] = None
+        self._char_cache: Dict[str, Char] = {}
         self.reset()
         self.mode = _DEFAULT_MODE.copy()
         self.margins: Optional[Margins] = None
@@ -227,21 +341,60 @@ class Screen:
         return ("{0}({1}, {2})".format(self.__class__.__name__,
                                        self.columns, self.lines))
 
+    def _make_row(self) -> StaticDefaultDict[int, Char]:
+        """Return an empty row for :attr:`buffer`.
+
+        Rows discarded by :meth:`reset` are recycled here to avoid
+        re-allocating a dict per line on screen clears.
+        """
+        if self._row_pool:
+            row = self._row_pool.pop()
+            row.default = self.default_char
+            row._has_wide = False
+            return row
+        return StaticDefaultDict[int, Char](self.default_char)
+
     @property
     def display(self) -> List[str]:
         """A :func:`list` of screen lines as unicode strings."""
         def render(line: StaticDefaultDict[int, Char]) -> Generator[str, None, None]:
-            is_wide_char = False
-            for x in range(self.columns):
-                if is_wide_char:  # Skip stub
-                    is_wide_char = False
-                    continue
-                char = line[x].data
-                assert sum(map(wcwidth, char[1:])) == 0
-                is_wide_char = wcwidth(char[0]) == 2
-                yield char
-
-        return ["".join(render(self.buffer[y])) for y in range(self.lines)]
+            pos = 0
+            if line._has_wide:
+                skip_next = -1
+                for x in sorted(line):
+                    if x >= self.columns:
+                        break
+                    if x == skip_next:  # Skip stub of a full-width char.
+                        continue
+                    if x > pos:
+                        yield " " * (x - pos)
+                        pos = x
+                    char = line[x]
+                    yield char.data or " "
+                    if char.width == 2:
+                        skip_next = x + 1
+                        pos = x + 2
+                    else:
+                        pos += 1
+            else:
+                # No full-width characters in this row -- no stub or
+                # width bookkeeping needed.
+                for x in sorted(line):
+                    if x >= self.columns:
+                        break
+                    if x > pos:
+                        yield " " * (x - pos)
+                        pos = x
+                    yield line[x].data or " "
+                    pos += 1
+
+            if pos < self.columns:
+                yield " " * (self.columns - pos)
+
+        blank_line = " " * self.columns
+        return ["".join(render(self.buffer[y])) if y in self.buffer
+                else blank_line
+                for y in range(self.lines)]
 
     def reset(self) -> None:
         """Reset the terminal to its initial state.
@@ -260,11 +413,18 @@ class Screen:
            and tabstops should be reset as well, thanks to
            :manpage:`xterm` -- we now know that.
         """
-        self.dirty.update(range(self.lines))
+        self.dirty.update(self._all_lines)
+        for row in self.buffer.values():
+            if len(self._row_pool) >= self.lines:
+                break
+            row.clear()
+            self._row_pool.append(row)
         self.buffer.clear()
         self.margins = None
 
         self.mode = _DEFAULT_MODE.copy()
+        self._refresh_default_char()
+        self._refresh_mode_flags()
 
         self.title = ""
         self.icon_name = ""
@@ -277,6 +437,7 @@ class Screen:
         # set every `n` spaces when the terminal is powered up. Since
         # we aim to support VT102 / VT220 and linux -- we use n = 8.
         self.tabstops = set(range(8, self.columns, 8))
+        self._sorted_tabstops: Optional[List[int]] = None
 
         self.cursor = Cursor(0, 0)
         self.cursor_position()
@@ -308,7 +469,8 @@ class Screen:
         if lines == self.lines and columns == self.columns:
             return  # No changes.
 
-        self.dirty.update(range(lines))
+        self._all_lines = set(range(lines))
+        self.dirty.update(self._all_lines)
 
         if lines < self.lines:
             self.save_cursor()
@@ -318,8 +480,10 @@ class Screen:
 
         if columns < self.columns:
             for line in self.buffer.values():
-                for x in range(columns, self.columns):
-                    line.pop(x, None)
+                # Only the occupied keys matter -- probing every column
+                # in the clipped range is wasteful on sparse rows.
+                for x in [x for x in line if x >= columns]:
+                    del line[x]
 
         self.lines, self.columns = lines, columns
         self.set_margins()
@@ -371,9 +535,12 @@ class Screen:
         if kwargs.get("private"):
             mode_list = [mode << 5 for mode in modes]
             if mo.DECSCNM in mode_list:
-                self.dirty.update(range(self.lines))
+                self.dirty.update(self._all_lines)
 
         self.mode.update(mode_list)
+        self._refresh_mode_flags()
+        if mo.DECSCNM in mode_list:
+            self._refresh_default_char()
 
         # When DECOLM mode is set, the screen is erased and the cursor
         # moves to the home position.
@@ -389,10 +556,16 @@ class Screen:
 
         # Mark all displayed characters as reverse.
         if mo.DECSCNM in mode_list:
+            # Screens hold few distinct Chars (interned by draw), so
+            # flip each distinct value once and reuse the result.
+            flipped: Dict[Char, Char] = {}
             for line in self.buffer.values():
                 line.default = self.default_char
-                for x in line:
-                    line[x] = line[x]._replace(reverse=True)
+                for x, cell in line.items():
+                    new = flipped.get(cell)
+                    if new is None:
+                        new = flipped[cell] = cell._replace(reverse=True)
+                    line[x] = new
 
             self.select_graphic_rendition(7)  # +reverse.
 
@@ -412,9 +585,12 @@ class Screen:
         if kwargs.get("private"):
             mode_list = [mode << 5 for mode in modes]
             if mo.DECSCNM in mode_list:
-                self.dirty.update(range(self.lines))
+                self.dirty.update(self._all_lines)
 
         self.mode.difference_update(mode_list)
+        self._refresh_mode_flags()
+        if mo.DECSCNM in mode_list:
+            self._refresh_default_char()
 
         # Lines below follow the logic in :meth:`set_mode`.
         if mo.DECCOLM in mode_list:
@@ -428,10 +604,14 @@ class Screen:
             self.cursor_position()
 
         if mo.DECSCNM in mode_list:
+            flipped: Dict[Char, Char] = {}
             for line in self.buffer.values():
                 line.default = self.default_char
-                for x in line:
-                    line[x] = line[x]._replace(reverse=False)
+                for x, cell in line.items():
+                    new = flipped.get(cell)
+                    if new is None:
+                        new = flipped[cell] = cell._replace(reverse=False)
+                    line[x] = new
 
             self.select_graphic_rendition(27)  # -reverse.
 
@@ -475,50 +655,144 @@ class Screen:
            and unprintable characters do not affect screen state. Full-width
            characters are rendered into two consecutive character containers.
         """
-        data = data.translate(
-            self.g1_charset if self.charset else self.g0_charset)
-
-        for char in data:
+        charset = self.g1_charset if self.charset else self.g0_charset
+        if charset is not cs.LAT1_MAP:
+            # Latin-1 is the identity mapping -- skip the string copy
+            # ``translate`` would otherwise make for every chunk.
+            data = data.translate(charset)
+
+        # Identical (character, attributes) pairs map to the same Char
+        # instance, so uniform text costs one dict lookup per character
+        # instead of an allocation.  The pool is invalidated whenever
+        # the cursor attributes change.
+        if self.cursor.attrs is not self._cached_attrs:
+            self._cached_attrs = self.cursor.attrs
+            self._char_cache = {}
+        char_cache = self._char_cache
+        dirty_add = self.dirty.add if self._track_dirty else None
+
+        irm = self._irm
+        decawm = self._decawm
+
+        # Locals are cheaper than attribute loads in the per-character
+        # loop; none of these can be rebound by the handlers draw calls.
+        buffer = self.buffer
+        cursor = self.cursor
+        columns = self.columns
+        carriage_return = self.carriage_return
+        linefeed = self.linefeed
+
+        # The current row, fetched once per line instead of once per
+        # character.  ``linefeed`` may scroll rows around, so wrapping
+        # resets ``line_y`` rather than relying on the y check alone.
+        line_y = -1
+        line: StaticDefaultDict[int, Char] = None  # type: ignore[assignment]
+
+        i = 0
+        size = len(data)
+        while i < size:
+            # Fast path: a run of printable ASCII in Replace mode needs
+            # no width, combining or insert handling -- write it to the
+            # row in bulk, wrapping line by line.
+            match = None if irm else _ASCII_RUN.match(data, i)
+            if match is not None:
+                end = match.end()
+                attrs = cursor.attrs
+                cache_get = char_cache.get
+                while i < end:
+                    if cursor.x == columns:
+                        if decawm:
+                            if dirty_add is not None:
+                                dirty_add(cursor.y)
+                            carriage_return()
+                            linefeed()
+                            line_y = -1
+                        else:
+                            # Without auto wrap every remaining char
+                            # lands in the last column -- only the final
+                            # one survives.
+                            char = data[end - 1]
+                            cell = cache_get(char)
+                            if cell is None:
+                                cell = char_cache[char] = \
+                                    attrs._replace(data=char)
+                            buffer[cursor.y][columns - 1] = cell
+                            if dirty_add is not None:
+                                dirty_add(cursor.y)
+                            i = end
+                            break
+
+                    x = cursor.x
+                    take = min(end - i, columns - x)
+                    if cursor.y != line_y:
+                        line_y = cursor.y
+                        line = buffer[line_y]
+                    cells: List[Char] = []
+                    append = cells.append
+                    for char in data[i:i + take]:
+                        cell = cache_get(char)
+                        if cell is None:
+                            cell = char_cache[char] = \
+                                attrs._replace(data=char)
+                        append(cell)
+                    line.update(zip(range(x, x + take), cells))
+                    cursor.x = x + take
+                    i += take
+                    if dirty_add is not None:
+                        dirty_add(cursor.y)
+                continue
+
+            char = data[i]
+            i += 1
             char_width = wcwidth(char)
 
             # If this was the last column in a line and auto wrap mode is
             # enabled, move the cursor to the beginning of the next line,
             # otherwise replace characters already displayed with newly
             # entered.
-            if self.cursor.x == self.columns:
-                if mo.DECAWM in self.mode:
-                    self.dirty.add(self.cursor.y)
-                    self.carriage_return()
-                    self.linefeed()
+            if cursor.x == columns:
+                if decawm:
+                    if dirty_add is not None:
+                        dirty_add(cursor.y)
+                    carriage_return()
+                    linefeed()
+                    line_y = -1
                 elif char_width > 0:
-                    self.cursor.x -= char_width
+                    cursor.x -= char_width
 
             # If Insert mode is set, new characters move old characters to
             # the right, otherwise terminal is in Replace mode and new
             # characters replace old characters at cursor position.
-            if mo.IRM in self.mode and char_width > 0:
+            if irm and char_width > 0:
                 self.insert_characters(char_width)
 
-            line = self.buffer[self.cursor.y]
+            if cursor.y != line_y:
+                line_y = cursor.y
+                line = buffer[line_y]
             if char_width == 1:
-                line[self.cursor.x] = self.cursor.attrs._replace(data=char)
+                cell = char_cache.get(char)
+                if cell is None:
+                    cell = char_cache[char] = \
+                        cursor.attrs._replace(data=char)
+                line[cursor.x] = cell
             elif char_width == 2:
                 # A two-cell character has a stub slot after it.
-                line[self.cursor.x] = self.cursor.attrs._replace(data=char)
-                if self.cursor.x + 1 < self.columns:
-                    line[self.cursor.x + 1] = self.cursor.attrs \
-                        ._replace(data="")
-            elif char_width == 0 and unicodedata.combining(char):
+                line._has_wide = True
+                line[cursor.x] = cursor.attrs._replace(data=char, width=2)
+                if cursor.x + 1 < columns:
+                    line[cursor.x + 1] = cursor.attrs \
+                        ._replace(data="", width=0)
+            elif char_width == 0 and _combining(char):
                 # A zero-cell character is combined with the previous
                 # character either on this or preceding line.
-                if self.cursor.x:
-                    last = line[self.cursor.x - 1]
-                    normalized = unicodedata.normalize("NFC", last.data + char)
-                    line[self.cursor.x - 1] = last._replace(data=normalized)
-                elif self.cursor.y:
-                    last = self.buffer[self.cursor.y - 1][self.columns - 1]
-                    normalized = unicodedata.normalize("NFC", last.data + char)
-                    self.buffer[self.cursor.y - 1][self.columns - 1] = \
+                if cursor.x:
+                    last = line[cursor.x - 1]
+                    normalized = _normalize("NFC", last.data + char)
+                    line[cursor.x - 1] = last._replace(data=normalized)
+                elif cursor.y:
+                    last = buffer[cursor.y - 1][columns - 1]
+                    normalized = _normalize("NFC", last.data + char)
+                    buffer[cursor.y - 1][columns - 1] = \
                         last._replace(data=normalized)
             else:
                 break  # Unprintable character or doesn't advance the cursor.
@@ -526,9 +800,10 @@ class Screen:
             # .. note:: We can't use :meth:`cursor_forward()`, because that
             #           way, we'll never know when to linefeed.
             if char_width > 0:
-                self.cursor.x = min(self.cursor.x + char_width, self.columns)
+                cursor.x = min(cursor.x + char_width, columns)
 
-        self.dirty.add(self.cursor.y)
+        if dirty_add is not None:
+            dirty_add(cursor.y)
 
     def set_title(self, param: str) -> None:
         """Set terminal title.
@@ -555,9 +830,16 @@ class Screen:
         top, bottom = self.margins or Margins(0, self.lines - 1)
         if self.cursor.y == bottom:
             # TODO: mark only the lines within margins?
-            self.dirty.update(range(self.lines))
+            self.dirty.update(self._all_lines)
+            # Move rows, not cells.  A missing source row still gets a
+            # fresh empty destination so the scrolled region stays as
+            # densely populated as the defaultdict reads used to leave
+            # it -- callers do observe buffer occupancy.
             for y in range(top, bottom):
-                self.buffer[y] = self.buffer[y + 1]
+                if y + 1 in self.buffer:
+                    self.buffer[y] = self.buffer.pop(y + 1)
+                else:
+                    self.buffer[y] = self._make_row()
             self.buffer.pop(bottom, None)
         else:
             self.cursor_down()
@@ -569,9 +851,12 @@ class Screen:
         top, bottom = self.margins or Margins(0, self.lines - 1)
         if self.cursor.y == top:
             # TODO: mark only the lines within margins?
-            self.dirty.update(range(self.lines))
+            self.dirty.update(self._all_lines)
             for y in range(bottom, top, -1):
-                self.buffer[y] = self.buffer[y - 1]
+                if y - 1 in self.buffer:
+                    self.buffer[y] = self.buffer.pop(y - 1)
+                else:
+                    self.buffer[y] = self._make_row()
             self.buffer.pop(top, None)
         else:
             self.cursor_up()
@@ -589,10 +874,12 @@ class Screen:
         """Move to the next tab space, or the end of the screen if there
         aren't anymore left.
         """
-        for stop in sorted(self.tabstops):
-            if self.cursor.x < stop:
-                column = stop
-                break
+        stops = self._sorted_tabstops
+        if stops is None:
+            stops = self._sorted_tabstops = sorted(self.tabstops)
+        idx = bisect_right(stops, self.cursor.x)
+        if idx < len(stops):
+            column = stops[idx]
         else:
             column = self.columns - 1
 
@@ -606,12 +893,17 @@ class Screen:
 
     def save_cursor(self) -> None:
         """Push the current cursor position onto the stack."""
-        self.savepoints.append(Savepoint(copy.copy(self.cursor),
+        # An explicit clone: ``copy.copy`` dispatches through
+        # ``__reduce_ex__`` for this ``__slots__`` class, which is an
+        # order of magnitude slower than the constructor.
+        cursor = Cursor(self.cursor.x, self.cursor.y, self.cursor.attrs)
+        cursor.hidden = self.cursor.hidden
+        self.savepoints.append(Savepoint(cursor,
                                          self.g0_charset,
                                          self.g1_charset,
                                          self.charset,
-                                         mo.DECOM in self.mode,
-                                         mo.DECAWM in self.mode))
+                                         self._decom,
+                                         self._decawm))
 
     def restore_cursor(self) -> None:
         """Set the current cursor position to whatever cursor is on top
@@ -693,10 +985,14 @@ class Screen:
 
         count = count or 1
         line = self.buffer[self.cursor.y]
-        for x in range(self.columns, self.cursor.x - 1, -1):
+        # Shift only the occupied cells; missing ones read as the row
+        # default before and after the move.  Rightmost first, so a
+        # moved cell never clobbers an unprocessed one.
+        for x in sorted((x for x in line if x >= self.cursor.x),
+                        reverse=True):
+            cell = line.pop(x)
             if x + count <= self.columns:
-                line[x + count] = line[x]
-            line.pop(x, None)
+                line[x + count] = cell
 
     def delete_characters(self, count: Optional[int] = None) -> None:
         """Delete the indicated # of characters, starting with the
@@ -710,11 +1006,12 @@ class Screen:
         count = count or 1
 
         line = self.buffer[self.cursor.y]
-        for x in range(self.cursor.x, self.columns):
-            if x + count <= self.columns:
-                line[x] = line.pop(x + count, self.default_char)
-            else:
-                line.pop(x, None)
+        # Leftmost first -- the target slot of every move was processed
+        # (and vacated) on an earlier iteration.
+        for x in sorted(x for x in line if x >= self.cursor.x):
+            cell = line.pop(x)
+            if x >= self.cursor.x + count:
+                line[x - count] = cell
 
     def erase_characters(self, count: Optional[int] = None) -> None:
         """Erase the indicated # of characters, starting with the
@@ -734,9 +1031,11 @@ class Screen:
         count = count or 1
 
         line = self.buffer[self.cursor.y]
-        for x in range(self.cursor.x,
-                       min(self.cursor.x + count, self.columns)):
-            line[x] = self.cursor.attrs
+        # A single C-level bulk assignment instead of one ``__setitem__``
+        # per column.
+        line.update(dict.fromkeys(
+            range(self.cursor.x, min(self.cursor.x + count, self.columns)),
+            self.cursor.attrs))
 
     def erase_in_line(self, how: int = 0, private: bool = False) -> None:
         """Erase a line in a specific way.
@@ -761,9 +1060,8 @@ class Screen:
         elif how == 2:
             interval = range(self.columns)
 
-        line = self.buffer[self.cursor.y]
-        for x in interval:
-            line[x] = self.cursor.attrs
+        self.buffer[self.cursor.y].update(
+            dict.fromkeys(interval, self.cursor.attrs))
 
     def erase_in_display(self, how: int= 0, *args: Any, **kwargs: Any) -> None:
         """Erases display in a specific way.
@@ -796,10 +1094,24 @@ class Screen:
             interval = range(self.lines)
 
         self.dirty.update(interval)
-        for y in interval:
-            line = self.buffer[y]
-            for x in line:
-                line[x] = self.cursor.attrs
+        attrs = self.cursor.attrs
+        default = self.default_char
+        if (how == 2 or how == 3) and (attrs is default or attrs == default):
+            # Erasing the whole display to default attributes is a
+            # plain clear -- recycle the rows like :meth:`reset` does
+            # instead of rewriting every occupied cell.
+            for row in self.buffer.values():
+                if len(self._row_pool) >= self.lines:
+                    break
+                row.clear()
+                self._row_pool.append(row)
+            self.buffer.clear()
+        else:
+            for y in interval:
+                line = self.buffer[y]
+                # Only occupied cells need overwriting -- missing ones
+                # already render as ``line.default``.
+                line.update(dict.fromkeys(line, attrs))
 
         if how == 0 or how == 1:
             self.erase_in_line(how)
@@ -807,6 +1119,7 @@ class Screen:
     def set_tab_stop(self) -> None:
         """Set a horizontal tab stop at cursor position."""
         self.tabstops.add(self.cursor.x)
+        self._sorted_tabstops = None
 
     def clear_tab_stop(self, how: int = 0) -> None:
         """Clear a horizontal tab stop.
@@ -824,6 +1137,8 @@ class Screen:
         elif how == 3:
             self.tabstops = set()  # Clears all horizontal tab stops.
 
+        self._sorted_tabstops = None
+
     def ensure_hbounds(self) -> None:
         """Ensure the cursor is within horizontal screen bounds."""
         self.cursor.x = min(max(0, self.cursor.x), self.columns - 1)
@@ -836,7 +1151,7 @@ class Screen:
                                  cursor is bounded by top and and bottom
                                  margins, instead of ``[0; lines - 1]``.
         """
-        if (use_margins or mo.DECOM in self.mode) and self.margins is not None:
+        if (use_margins or self._decom) and self.margins is not None:
             top, bottom = self.margins
         else:
             top, bottom = 0, self.lines - 1
@@ -917,7 +1232,7 @@ class Screen:
 
         # If origin mode (DECOM) is set, line number are relative to
         # the top scrolling margin.
-        if self.margins is not None and mo.DECOM in self.mode:
+        if self.margins is not None and self._decom:
             line += self.margins.top
 
             # Cursor is not allowed to move out of the scrolling region.
@@ -962,56 +1277,82 @@ class Screen:
 
     def alignment_display(self) -> None:
         """Fills screen with uppercase E's for screen focus and alignment."""
-        self.dirty.update(range(self.lines))
+        self.dirty.update(self._all_lines)
+        fill = self.default_char._replace(data="E", width=1)
+        full = dict.fromkeys(range(self.columns), fill)
+        replaced: Dict[Char, Char] = {}
         for y in range(self.lines):
-            for x in range(self.columns):
-                self.buffer[y][x] = self.buffer[y][x]._replace(data="E")
+            line = self.buffer[y]
+            if not line:
+                # An untouched row becomes all E's in one bulk update.
+                line.update(full)
+                continue
+            # Rows hold few distinct Chars -- substitute each distinct
+            # value once, keeping the cell attributes.  ``width`` is
+            # forced back to one: a former fullwidth cell (or its stub)
+            # now holds a single-width "E".
+            for x, cell in line.items():
+                new = replaced.get(cell)
+                if new is None:
+                    new = replaced[cell] = cell._replace(data="E", width=1)
+                line[x] = new
+            if len(line) < self.columns:
+                line.update((x, fill) for x in range(self.columns)
+                            if x not in line)
 
     def select_graphic_rendition(self, *attrs: int) -> None:
         """Set display attributes.
 
         :param list attrs: a list of display attributes to set.
         """
-        replace = {}
+        if self._disable_display_graphic:
+            return
 
         # Fast path for resetting all attributes.
         if not attrs or attrs == (0, ):
             self.cursor.attrs = self.default_char
             return
 
-        attrs_list = list(reversed(attrs))
+        # Fast path for the very common single-parameter sequences,
+        # e.g. ``ESC[1m`` or ``ESC[31m``.
+        if len(attrs) == 1:
+            entry = _SGR_TABLE.get(attrs[0])
+            if entry is not None:
+                self.cursor.attrs = self.cursor.attrs \
+                    ._replace(**{entry[0]: entry[1]})
+            return
 
-        while attrs_list:
-            attr = attrs_list.pop()
-            if attr == 0:
+        replace = {}
+        i = 0
+        size = len(attrs)
+        while i < size:
+            attr = attrs[i]
+            i += 1
+            entry = _SGR_TABLE.get(attr)
+            if entry is not None:
+                replace[entry[0]] = entry[1]
+            elif attr == 0:
                 # Reset all attributes.
-                replace.update(self.default_char._asdict())
-            elif attr in g.FG_ANSI:
-                replace["fg"] = g.FG_ANSI[attr]
-            elif attr in g.BG:
-                replace["bg"] = g.BG_ANSI[attr]
-            elif attr in g.TEXT:
-                attr_str = g.TEXT[attr]
-                replace[attr_str[1:]] = attr_str.startswith("+")
-            elif attr in g.FG_AIXTERM:
-                replace.update(fg=g.FG_AIXTERM[attr])
-            elif attr in g.BG_AIXTERM:
-                replace.update(bg=g.BG_AIXTERM[attr])
-            elif attr in (g.FG_256, g.BG_256):
+                replace.update(self._default_char_items)
+            elif attr == g.FG_256 or attr == g.BG_256:
                 key = "fg" if attr == g.FG_256 else "bg"
                 try:
-                    n = attrs_list.pop()
+                    n = attrs[i]
+                    i += 1
                     if n == 5:    # 256.
-                        m = attrs_list.pop()
-                        replace[key] = g.FG_BG_256[m]
+                        replace[key] = g.FG_BG_256[attrs[i]]
+                        i += 1
                     elif n == 2:  # 24bit.
                         # This is somewhat non-standard but is nonetheless
                         # supported in quite a few terminals. See discussion
                         # here https://gist.github.com/XVilka/8346728.
                         replace[key] = "{0:02x}{1:02x}{2:02x}".format(
-                            attrs_list.pop(), attrs_list.pop(), attrs_list.pop())
+                            attrs[i], attrs[i + 1], attrs[i + 2])
+                        i += 3
                 except IndexError:
-                    pass
+                    # Ran off the end of a truncated extended-color
+                    # sequence, exactly like the old pop()-based loop.
+                    break
 
         self.cursor.attrs = self.cursor.attrs._replace(**replace)
 
@@ -1138,29 +1479,15 @@ class HistoryScreen(Screen):
     _wrapped = set(Stream.events)
     _wrapped.update(["next_page", "prev_page"])
 
-    def __init__(self, columns: int, lines: int, history: int = 100, ratio: float = .5) -> None:
+    def __init__(self, columns: int, lines: int, history: int = 100,
+                 ratio: float = .5, **kwargs: Any) -> None:
         self.history = History(deque(maxlen=history),
                                deque(maxlen=history),
                                float(ratio),
                                history,
                                history)
 
-        super(HistoryScreen, self).__init__(columns, lines)
-
-    def _make_wrapper(self, event: str, handler: Callable[..., Any]) -> Callable[..., Any]:
-        def inner(*args: Any, **kwargs: Any) -> Any:
-            self.before_event(event)
-            result = handler(*args, **kwargs)
-            self.after_event(event)
-            return result
-        return inner
-
-    def __getattribute__(self, attr: str) -> Callable[..., Any]:
-        value = super(HistoryScreen, self).__getattribute__(attr)
-        if attr in HistoryScreen._wrapped:
-            return HistoryScreen._make_wrapper(self, attr, value)
-        else:
-            return value  # type: ignore[no-any-return]
+        super(HistoryScreen, self).__init__(columns, lines, **kwargs)
 
     def before_event(self, event: str) -> None:
         """Ensure a screen is at the bottom of the history buffer.
@@ -1246,12 +1573,16 @@ class HistoryScreen(Screen):
             self.history = self.history \
                 ._replace(position=self.history.position - mid)
 
-            for y in range(self.lines - 1, mid - 1, -1):
-                self.buffer[y] = self.buffer[y - mid]
+            # Shift the visible rows down by ``mid`` in one bulk
+            # rebuild instead of a per-row assignment loop.
+            shifted = {y + mid: self.buffer[y]
+                       for y in range(self.lines - mid)}
             for y in range(mid - 1, -1, -1):
-                self.buffer[y] = self.history.top.pop()
+                shifted[y] = self.history.top.pop()
+            self.buffer.clear()
+            self.buffer.update(shifted)
 
-            self.dirty = set(range(self.lines))
+            self.dirty.update(self._all_lines)
 
     def next_page(self) -> None:
         """Move the screen page down through the history buffer."""
@@ -1263,12 +1594,39 @@ class HistoryScreen(Screen):
             self.history = self.history \
                 ._replace(position=self.history.position + mid)
 
-            for y in range(self.lines - mid):
-                self.buffer[y] = self.buffer[y + mid]
+            shifted = {y: self.buffer[y + mid]
+                       for y in range(self.lines - mid)}
             for y in range(self.lines - mid, self.lines):
-                self.buffer[y] = self.history.bottom.popleft()
+                shifted[y] = self.history.bottom.popleft()
+            self.buffer.clear()
+            self.buffer.update(shifted)
+
+            self.dirty.update(self._all_lines)
 
-            self.dirty = set(range(self.lines))
+
+def _wrap_event(event: str, handler: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an event handler with :meth:`HistoryScreen.before_event`
+    and :meth:`HistoryScreen.after_event` calls.
+    """
+    @wraps(handler)
+    def inner(self: HistoryScreen, *args: Any, **kwargs: Any) -> Any:
+        self.before_event(event)
+        result = handler(self, *args, **kwargs)
+        self.after_event(event)
+        return result
+    return inner
+
+
+# Wrap the event handlers once at class-creation time.  The previous
+# implementation intercepted *every* attribute access through
+# ``__getattribute__`` and allocated a fresh closure per call, taxing
+# each ``self.<anything>`` read in the inherited hot paths.  Note that
+# further subclasses overriding a wrapped event must now call
+# ``before_event``/``after_event`` themselves (or re-wrap).
+for _event in HistoryScreen._wrapped:
+    setattr(HistoryScreen, _event,
+            _wrap_event(_event, getattr(HistoryScreen, _event)))
+del _event
 
 
 class DebugEvent(NamedTuple):
@@ -1325,8 +1683,7 @@ class DebugScreen:
 
     def only_wrapper(self, attr: str) -> Callable[..., None]:
         def wrapper(*args: Any, **kwargs: Any) -> None:
-            self.to.write(str(DebugEvent(attr, args, kwargs)))
-            self.to.write(str(os.linesep))
+            self.to.write(str(DebugEvent(attr, args, kwargs)) + os.linesep)
 
         return wrapper
 
@@ -202,7 +202,7 @@ class Stream:
                 else:
                     taking_plain_text = False
             else:
-                taking_plain_text = send(data[offset:offset + 1])
+                taking_plain_text = send(data[offset])
                 offset += 1
 
         self._taking_plain_text = taking_plain_text
@@ -419,7 +419,8 @@ class ByteStream(Stream):
         if self.use_utf8:
             data_str = self.utf8_decoder.decode(data)
         else:
-            data_str = "".join(map(chr, data))
+            # Same mapping as ``"".join(map(chr, data))``, but done in C.
+            data_str = data.decode("latin-1")
 
         super(ByteStream, self).feed(data_str)
 
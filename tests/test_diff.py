@@ -147,3 +147,35 @@ def test_draw_multiple_chars_wrap():
     screen.draw("1234567890")
     assert screen.cursor.y == 1
     assert screen.dirty == set([0, 1])
+
+
+def test_track_dirty_lines_disabled():
+    screen = pyte.Screen(80, 24, track_dirty_lines=False)
+    assert not screen.dirty
+
+    # a) single-line updates.
+    screen.draw("foo")
+    screen.insert_characters(2)
+    screen.erase_in_line()
+    screen.erase_in_display()
+    assert not screen.dirty
+
+    # b) scrolling and line insertion/removal.
+    screen.cursor_to_line(screen.lines)
+    screen.index()
+    screen.reverse_index()
+    screen.insert_lines(2)
+    screen.delete_lines(2)
+    assert not screen.dirty
+
+    # c) whole-screen updates.
+    screen.reset()
+    screen.resize(130, 24)
+    screen.alignment_display()
+    assert not screen.dirty
+
+    # The default-constructed screen still tracks dirty lines.
+    screen = pyte.Screen(80, 24)
+    screen.dirty.clear()
+    screen.draw("f")
+    assert screen.dirty == {0}
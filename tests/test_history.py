@@ -532,3 +532,16 @@ def test_erase_in_display():
     screen.erase_in_display(3)
     assert not screen.history.top
     assert not screen.history.bottom
+
+
+def test_track_dirty_lines_disabled():
+    screen = pyte.HistoryScreen(5, 5, history=50, track_dirty_lines=False)
+    screen.set_mode(mo.LNM)
+
+    for idx in range(screen.lines * 2):
+        screen.draw(str(idx))
+        screen.linefeed()
+
+    screen.prev_page()
+    screen.next_page()
+    assert not screen.dirty
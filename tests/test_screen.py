@@ -64,6 +64,23 @@ def test_attributes():
     ]
 
 
+def test_disable_display_graphic():
+    screen = pyte.Screen(2, 2, disable_display_graphic=True)
+    screen.select_graphic_rendition(1)   # bold.
+    screen.select_graphic_rendition(31)  # red.
+    screen.select_graphic_rendition(38, 5, 100)
+    assert screen.cursor.attrs == screen.default_char
+
+    # Drawing still works -- cells just keep the default attributes.
+    screen.draw("f")
+    assert screen.buffer[0][0] == screen.default_char._replace(data="f")
+
+    # The default-constructed screen applies SGR as before.
+    screen = pyte.Screen(2, 2)
+    screen.select_graphic_rendition(1)
+    assert screen.cursor.attrs.bold
+
+
 def test_blink():
     screen = pyte.Screen(2, 2)
     assert tolist(screen) == [[screen.default_char, screen.default_char]] * 2
@@ -1487,6 +1504,20 @@ def test_alignment_display():
                               "EEEEE"]
 
 
+def test_alignment_display_wide_characters():
+    screen = pyte.Screen(6, 2)
+    stream = pyte.Stream(screen)
+    stream.feed("aコb")
+
+    assert screen.display == ["aコb  ", "      "]
+
+    screen.alignment_display()
+
+    # Fullwidth cells and their stubs must come back single-width,
+    # otherwise ``display`` renders the row short.
+    assert screen.display == ["EEEEEE", "EEEEEE"]
+
+
 def test_set_margins():
     screen = pyte.Screen(10, 10)
 